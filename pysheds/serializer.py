@@ -1,24 +1,515 @@
+import os
 import json
+import logging
+import atexit
+import hashlib
+import functools
+import threading
+import concurrent.futures
 import numpy as np
 from pathlib import Path
-from typing import Union, Dict, Any
+from typing import Union, Dict, Any, Optional, Tuple
 from pysheds.sgrid import sGrid
 from pysheds.sview import Raster, MultiRaster, ViewFinder
 from affine import Affine
 from pysheds import projection
 
+logger = logging.getLogger(__name__)
+
+try:
+    import zarr
+    import numcodecs
+    # The container format is written with the zarr 2.x API (`Group.array`,
+    # the `compressor=` keyword), which zarr 3 removed; treat incompatible
+    # versions like a missing zarr and fall back to the `.npz` container
+    _HAS_ZARR = zarr.__version__.split('.')[0] == '2'
+    if not _HAS_ZARR:
+        logger.warning("zarr %s is not supported (zarr>=2,<3 required); "
+                       "falling back to npz containers", zarr.__version__)
+except ModuleNotFoundError:
+    _HAS_ZARR = False
+
+if _HAS_ZARR:
+    # Pin the Blosc thread pool once at import so every chunk compresses
+    # and decompresses with consistent parallelism, and reuse a single
+    # codec instance instead of constructing one per call
+    numcodecs.blosc.use_threads = True
+    # os.cpu_count() may return None on exotic platforms
+    numcodecs.blosc.set_nthreads(max(1, (os.cpu_count() or 2) // 2))
+    _COMPRESSOR = numcodecs.Blosc(cname='zstd', clevel=3,
+                                  shuffle=numcodecs.Blosc.BITSHUFFLE)
+
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+
+    def _loads(data: Union[bytes, str]) -> Any:
+        return orjson.loads(data)
+except ModuleNotFoundError:
+    # Compact separators: pretty-printing is slower and ~3x larger
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode()
+
+    def _loads(data: Union[bytes, str]) -> Any:
+        return json.loads(data)
+
+
+@functools.lru_cache(maxsize=128)
+def _load_meta(path_str: str, mtime_ns: int) -> Any:
+    """Parse a JSON metadata file, cached on `(path, mtime)`."""
+    return _loads(Path(path_str).read_bytes())
+
+
+def _read_meta(path: Union[str, Path]) -> Any:
+    """
+    Read a JSON metadata file through an lru_cache keyed on the file's
+    mtime, so repeated loads of the same bundle skip parsing. The cache
+    invalidates automatically when the file changes on disk.
+    """
+    return _load_meta(str(path), os.stat(path).st_mtime_ns)
+
+
+def _write_container(base_path: Union[str, Path], arrays: Dict[str, np.ndarray],
+                     metadata: Dict[str, Any]) -> str:
+    """
+    Write arrays and metadata to a single `.pysh` container.
+
+    Uses one zarr group per object (arrays compressed with Blosc zstd,
+    metadata stored in the group attributes) when zarr is available;
+    otherwise a single `.npz` with the JSON metadata embedded as bytes.
+    One container means one open/fsync/directory entry per object instead
+    of three sidecar files. Returns the container path.
+    """
+    if _HAS_ZARR:
+        path = f"{base_path}.pysh"
+        root = zarr.open_group(path, mode='w')
+        _write_group(root, arrays, metadata)
+        return path
+    else:
+        path = f"{base_path}.pysh.npz"
+        meta_bytes = np.frombuffer(_dumps(metadata), dtype=np.uint8)
+        np.savez_compressed(path, meta=meta_bytes, **arrays)
+        return path
+
+
+def _chunks(array: np.ndarray) -> Optional[tuple]:
+    """
+    Tile-shaped chunks for raster arrays, so subregion reads touch only
+    the relevant chunks and each chunk decompresses on a separate thread.
+    MultiRaster bands chunk one band at a time.
+    """
+    if array.ndim == 2:
+        return (min(1024, array.shape[0]), min(1024, array.shape[1]))
+    elif array.ndim == 3:
+        return (1, min(1024, array.shape[1]), min(1024, array.shape[2]))
+    return None
+
+
+def _write_group(group: 'zarr.Group', arrays: Dict[str, np.ndarray],
+                 metadata: Dict[str, Any]) -> None:
+    """Write arrays and metadata attributes into an open zarr group."""
+    for name, array in arrays.items():
+        group.array(name, array, chunks=_chunks(array), compressor=_COMPRESSOR)
+    group.attrs.update(metadata)
+
+
+def _open_container(base_path: Union[str, Path]) -> Optional[Tuple[Dict[str, Any], Any]]:
+    """
+    Open a `.pysh` container, returning `(metadata, arrays)` where `arrays`
+    is a dict-like mapping of names to arrays. Returns None when no
+    container exists (legacy sidecar layout).
+    """
+    zarr_path = Path(f"{base_path}.pysh")
+    if zarr_path.exists() and _HAS_ZARR:
+        root = zarr.open_group(str(zarr_path), mode='r')
+        return dict(root.attrs), root
+    npz_path = Path(f"{base_path}.pysh.npz")
+    if npz_path.exists():
+        archive = np.load(npz_path)
+        metadata = _loads(bytes(archive['meta']))
+        return metadata, archive
+    return None
+
+
+def _read_array(path_stem: Union[str, Path], name: str, backend: str) -> np.ndarray:
+    """
+    Read a legacy array sidecar written before the `.pysh` container
+    format (either a zarr store or an `.npz` file per array).
+    """
+    if backend == 'zarr':
+        return zarr.load(f"{path_stem}_{name}.zarr")
+    else:
+        with np.load(f"{path_stem}_{name}.npz") as f:
+            return f[name]
+
+
+# Above this many objects the save_objects index is written as NDJSON
+_NDJSON_THRESHOLD = 128
+
+
+# Background executor for asynchronous saves; pending futures are tracked
+# so `flush` (registered with atexit) can guarantee nothing is lost
+_ASYNC_EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+_PENDING_WRITES: list = []
+_PENDING_LOCK = threading.Lock()
+
+
+def _submit_write(fn, *args) -> 'concurrent.futures.Future':
+    """Submit a write to the background executor and track it for `flush`."""
+    future = _ASYNC_EXECUTOR.submit(fn, *args)
+    with _PENDING_LOCK:
+        _PENDING_WRITES[:] = [f for f in _PENDING_WRITES if not f.done()]
+        _PENDING_WRITES.append(future)
+    return future
+
+
+# Maps stored data dtypes to nodata casters; a single dict lookup replaces
+# a chain of np.issubdtype checks on every load
+_NODATA_CAST = {
+    np.dtype('float32'): np.float32,
+    np.dtype('float64'): np.float64,
+    np.dtype('int8'): np.int8,
+    np.dtype('int16'): np.int16,
+    np.dtype('int32'): np.int32,
+    np.dtype('int64'): np.int64,
+    np.dtype('uint8'): np.uint8,
+    np.dtype('uint16'): np.uint16,
+    np.dtype('uint32'): np.uint32,
+    np.dtype('uint64'): np.uint64,
+}
+
+
+def _pack_mask(mask: np.ndarray) -> np.ndarray:
+    """Bit-pack a boolean mask to 1 bit per cell (8x smaller payload)."""
+    return np.packbits(mask.ravel(order='C'))
+
+
+def _unpack_mask(packed: np.ndarray, nbits: int, shape: tuple) -> np.ndarray:
+    """Reverse `_pack_mask`, restoring the original boolean array."""
+    return np.unpackbits(packed, count=nbits).reshape(shape).astype(bool)
+
+
+def _json_nodata(value: Any) -> Union[float, str]:
+    """
+    JSON-safe representation of a nodata value. The `v != v` NaN test is
+    branchless and works for any scalar type, unlike the np.isnan ufunc,
+    which raises or coerces for integer and boolean nodata.
+    """
+    if value != value:
+        return 'nan'
+    elif isinstance(value, (int, float, np.floating, np.integer, np.bool_)):
+        return float(value)
+    return str(value)
+
+
+def _mask_payload(mask: np.ndarray) -> Tuple[Dict[str, np.ndarray], Dict[str, Any]]:
+    """
+    Build the arrays and metadata describing a mask. Masks that are
+    entirely True or entirely False (the common case) are recorded as a
+    scalar sentinel in the metadata, skipping the array write altogether;
+    anything else is bit-packed.
+    """
+    nz = np.count_nonzero(mask)
+    if nz == mask.size:
+        return {}, {'mask_kind': 'all_true'}
+    elif nz == 0:
+        return {}, {'mask_kind': 'all_false'}
+    return {'mask': _pack_mask(mask)}, {'mask_packed': True, 'mask_nbits': mask.size}
+
+
+def _grid_metadata(vf: ViewFinder,
+                   shared_ref: Optional[Tuple[int, int]] = None) -> Dict[str, Any]:
+    """
+    Serialize a viewfinder's CRS and affine. `str(vf.crs)` runs the
+    pyproj WKT formatter, which is expensive; when `shared_ref =
+    (crs_id, affine_id)` is given (bundle saves), integer references
+    into the bundle's shared block are stored instead.
+    """
+    if shared_ref is not None:
+        return {'crs_id': shared_ref[0], 'affine_id': shared_ref[1]}
+    return {'affine': list(vf.affine), 'crs': str(vf.crs)}
+
+
+def _resolve_shared(metadata: Dict[str, Any],
+                    shared: Optional[Dict[str, list]]) -> Dict[str, Any]:
+    """Expand `crs_id`/`affine_id` references back to full values."""
+    if 'crs_id' in metadata or 'affine_id' in metadata:
+        metadata = dict(metadata)
+        if 'crs_id' in metadata:
+            metadata['crs'] = shared['crs'][metadata.pop('crs_id')]
+        if 'affine_id' in metadata:
+            metadata['affine'] = shared['affine'][metadata.pop('affine_id')]
+    return metadata
+
+
+def _sgrid_payload(grid: sGrid,
+                   shared_ref: Optional[Tuple[int, int]] = None) -> Tuple[Dict[str, np.ndarray],
+                                                                          Dict[str, Any]]:
+    """Build the arrays and metadata describing an sGrid."""
+    vf = grid.viewfinder
+    arrays, mask_metadata = _mask_payload(vf.mask)
+    metadata = {
+        'type': 'sGrid',
+        'shape': vf.shape,
+        'nodata': _json_nodata(vf.nodata),
+        'mask_shape': vf.mask.shape,
+        'mask_dtype': str(vf.mask.dtype),
+        **_grid_metadata(vf, shared_ref),
+        **mask_metadata
+    }
+    return arrays, metadata
+
+
+def _raster_payload(raster: Union[Raster, MultiRaster],
+                    shared_ref: Optional[Tuple[int, int]] = None) -> Tuple[Dict[str, np.ndarray],
+                                                                           Dict[str, Any]]:
+    """Build the arrays and metadata describing a Raster or MultiRaster."""
+    vf = raster.viewfinder
+    raster_type = 'MultiRaster' if isinstance(raster, MultiRaster) else 'Raster'
+    # Extract the underlying buffer once as a plain, C-contiguous ndarray:
+    # a view when the raster is already contiguous (the usual case), and
+    # the layout Blosc's SIMD shuffle requires either way
+    data = np.ascontiguousarray(raster).view(np.ndarray)
+    arrays, mask_metadata = _mask_payload(vf.mask)
+    if raster_type == 'MultiRaster':
+        # Store bands as separate contiguous arrays (SoA layout): the
+        # shuffle+zstd codec then sees homogeneous per-band data, which
+        # improves both ratio and throughput, and bands decompress
+        # independently
+        for i in range(data.shape[0]):
+            arrays[f'band_{i}'] = np.ascontiguousarray(data[i])
+        band_split = data.shape[0]
+    else:
+        arrays['data'] = data
+        band_split = None
+    metadata = {
+        'type': raster_type,
+        'data_shape': raster.shape,
+        'data_dtype': str(raster.dtype),
+        'viewfinder_shape': vf.shape,
+        'nodata': _json_nodata(vf.nodata),
+        'mask_shape': vf.mask.shape,
+        'mask_dtype': str(vf.mask.dtype),
+        'metadata': raster.metadata,
+        **_grid_metadata(vf, shared_ref),
+        **mask_metadata
+    }
+    if band_split is not None:
+        metadata['band_split'] = band_split
+    return arrays, metadata
+
+
+def _data_keys(metadata: Dict[str, Any]) -> list:
+    """Names of the stored data arrays ('data', or one key per band)."""
+    band_split = metadata.get('band_split')
+    if band_split is not None:
+        return [f'band_{i}' for i in range(band_split)]
+    return ['data']
+
+
+def _load_data(metadata: Dict[str, Any], arrays: Any,
+               window: Optional[Tuple[slice, slice]] = None) -> np.ndarray:
+    """
+    Materialize the stored data arrays, restacking split bands and
+    honoring an optional `(row_slice, col_slice)` window. With a zarr
+    store only the windowed chunks are decompressed.
+    """
+    band_split = metadata.get('band_split')
+    if band_split is not None:
+        index = tuple(window) if window is not None else slice(None)
+        return np.stack([arrays[f'band_{i}'][index] for i in range(band_split)])
+    if window is not None:
+        return arrays['data'][_window_index(metadata, window)]
+    return np.asarray(arrays['data'])
+
+
+def _quantize(arrays: Dict[str, np.ndarray], metadata: Dict[str, Any],
+              dtype_out: Union[str, np.dtype], scale: Optional[float],
+              offset: Optional[float]) -> None:
+    """
+    Quantize the data array in place: float64 -> float32, or any float ->
+    scaled int16. Halves (or quarters) the bytes the compressor sees;
+    the parameters needed to dequantize are recorded in the metadata.
+    """
+    dtype_out = np.dtype(dtype_out)
+    if dtype_out == np.float32:
+        for key in _data_keys(metadata):
+            arrays[key] = arrays[key].astype(np.float32)
+        metadata['quantized'] = 'float32'
+        metadata['data_dtype'] = 'float32'
+    elif dtype_out == np.int16:
+        if scale is None:
+            raise ValueError('`scale` is required for int16 quantization.')
+        offset = 0. if offset is None else offset
+        # Nodata cells (typically sentinels like -9999) would overflow the
+        # int16 range and wrap to garbage, so they are mapped to a reserved
+        # sentinel (int16 min) and restored exactly on load; data cells
+        # must fit the remaining range or the save fails loudly
+        info = np.iinfo(np.int16)
+        nodata = metadata['nodata']
+        for key in _data_keys(metadata):
+            data = arrays[key]
+            nodata_cells = np.isnan(data) if nodata == 'nan' else (data == nodata)
+            quantized = np.round((data - offset) / scale)
+            valid = quantized[~nodata_cells]
+            if valid.size and (valid.min() <= info.min or valid.max() > info.max):
+                raise ValueError('Data does not fit the int16 range with '
+                                 f'scale={scale}, offset={offset}; '
+                                 'adjust the quantization parameters.')
+            arrays[key] = np.where(nodata_cells, info.min, quantized).astype(np.int16)
+        metadata['quantized'] = 'int16'
+        metadata['scale'] = float(scale)
+        metadata['offset'] = float(offset)
+        metadata['quantized_nodata'] = int(info.min)
+        # Loads dequantize to float32, so cast nodata accordingly
+        metadata['data_dtype'] = 'float32'
+    else:
+        raise ValueError(f"Unsupported quantization dtype: {dtype_out}")
+
+
+def _dequantize(metadata: Dict[str, Any], data: np.ndarray) -> np.ndarray:
+    """Reverse `_quantize` for scaled-integer storage."""
+    if metadata.get('quantized') == 'int16':
+        out = data.astype(np.float32) * metadata['scale'] + metadata['offset']
+        sentinel = metadata.get('quantized_nodata')
+        if sentinel is not None:
+            # Restore nodata cells exactly rather than dequantizing them
+            nodata = metadata['nodata']
+            out[data == sentinel] = np.float32(np.nan if nodata == 'nan' else nodata)
+        return out
+    return data
+
+
+def _window_index(metadata: Dict[str, Any], window: Tuple[slice, slice]) -> tuple:
+    """Expand a `(row_slice, col_slice)` window to the stored data's rank."""
+    if metadata['type'] == 'MultiRaster':
+        return (slice(None),) + tuple(window)
+    return tuple(window)
+
+
+def _window_metadata(metadata: Dict[str, Any],
+                     window: Tuple[slice, slice]) -> Dict[str, Any]:
+    """Shift the affine transform to the top-left corner of a window."""
+    row_start = window[0].start or 0
+    col_start = window[1].start or 0
+    affine = Affine(*metadata['affine']) * Affine.translation(col_start, row_start)
+    metadata = dict(metadata)
+    metadata['affine'] = list(affine)
+    return metadata
+
+
+def _load_mask(metadata: Dict[str, Any], fetch) -> np.ndarray:
+    """
+    Reconstruct a stored mask. Constant masks are rebuilt from the
+    metadata sentinel without touching the array store; otherwise `fetch`
+    is called to read the stored array, which is unpacked when the
+    metadata says it was bit-packed.
+    """
+    mask_kind = metadata.get('mask_kind')
+    if mask_kind == 'all_true':
+        return np.ones(tuple(metadata['mask_shape']), dtype=bool)
+    elif mask_kind == 'all_false':
+        return np.zeros(tuple(metadata['mask_shape']), dtype=bool)
+    mask = np.asarray(fetch())
+    if metadata.get('mask_packed', False):
+        return _unpack_mask(mask, metadata['mask_nbits'],
+                            tuple(metadata['mask_shape']))
+    return mask
+
+
+# ViewFinder construction re-validates the affine/mask/crs and runs the
+# pyproj CRS parser; bundles of rasters sharing one grid (the common
+# pysheds pipeline) pay that once per object. Cache by content so repeat
+# ViewFinders are reused.
+_VIEWFINDER_CACHE: Dict[tuple, ViewFinder] = {}
+_VIEWFINDER_LOCK = threading.Lock()
+
+
+def _make_viewfinder(metadata: Dict[str, Any], shape_key: str,
+                     nodata: Any, mask: np.ndarray) -> ViewFinder:
+    """
+    Construct (or fetch from cache) the ViewFinder described by the
+    metadata. The cache key hashes the mask bytes with blake2b, so
+    loads of rasters sharing a grid reuse a single validated instance.
+    """
+    mask_hash = hashlib.blake2b(mask.tobytes(), digest_size=16).hexdigest()
+    key = (tuple(metadata['affine']), tuple(metadata[shape_key]),
+           metadata['crs'], repr(nodata), mask_hash)
+    with _VIEWFINDER_LOCK:
+        viewfinder = _VIEWFINDER_CACHE.get(key)
+    if viewfinder is not None:
+        return viewfinder
+    viewfinder = ViewFinder(
+        affine=Affine(*metadata['affine']),
+        shape=tuple(metadata[shape_key]),
+        nodata=nodata,
+        mask=mask,
+        crs=projection.to_proj(metadata['crs'])
+    )
+    with _VIEWFINDER_LOCK:
+        if len(_VIEWFINDER_CACHE) >= 128:
+            _VIEWFINDER_CACHE.clear()
+        _VIEWFINDER_CACHE[key] = viewfinder
+    return viewfinder
+
+
+def _reconstruct_sgrid(metadata: Dict[str, Any], mask: np.ndarray) -> sGrid:
+    """Rebuild an sGrid from its metadata and mask array."""
+    # Handle NaN nodata values and ensure proper numpy type
+    nodata = metadata['nodata']
+    if nodata == 'nan':
+        nodata = np.nan
+    else:
+        nodata = np.float64(nodata)
+
+    # Reconstruct ViewFinder. Unlike Raster, sGrid keeps the instance it
+    # is given and its setters mutate it in place, so hand it a copy to
+    # keep cached ViewFinders (and other loaded grids) isolated
+    viewfinder = _make_viewfinder(metadata, 'shape', nodata, mask)
+
+    return sGrid(viewfinder.copy())
+
+
+def _reconstruct_raster(metadata: Dict[str, Any], data: np.ndarray,
+                        mask: np.ndarray) -> Union[Raster, MultiRaster]:
+    """Rebuild a Raster or MultiRaster from its metadata and arrays."""
+    # Handle NaN nodata values and ensure proper numpy type
+    nodata = metadata['nodata']
+    data_dtype = np.dtype(metadata['data_dtype'])
+    if nodata == 'nan':
+        # Keep NaN as a scalar of the data dtype so the viewfinder's
+        # nodata remains safely castable to the array
+        nodata = data_dtype.type(np.nan)
+    else:
+        # Cast to numpy type that matches the data dtype
+        try:
+            nodata = _NODATA_CAST[data_dtype](nodata)
+        except KeyError:
+            raise ValueError(f"Unsupported data dtype: {data_dtype}")
+
+    # Reconstruct ViewFinder
+    viewfinder = _make_viewfinder(metadata, 'viewfinder_shape', nodata, mask)
+
+    # Create appropriate raster type
+    if metadata['type'] == 'MultiRaster':
+        return MultiRaster(data, viewfinder, metadata['metadata'])
+    else:
+        return Raster(data, viewfinder, metadata['metadata'])
+
 
 class PyshedsSerializer:
     """
     Fast JSON + NumPy serialization for pysheds objects.
     Supports sGrid, Raster, and MultiRaster objects.
     """
-    
+
     @staticmethod
     def save_sgrid(grid: sGrid, base_filename: Union[str, Path]) -> None:
         """
-        Save an sGrid object using JSON + NumPy format.
-        
+        Save an sGrid object to a single `.pysh` container.
+
         Parameters
         ----------
         grid : sGrid
@@ -27,196 +518,196 @@ class PyshedsSerializer:
             Base filename (without extension)
         """
         base_path = Path(base_filename)
-        base_path.mkdir(parents=True, exist_ok=True)
-        
-        vf = grid.viewfinder
-        
-        # Save metadata as JSON
-        metadata = {
-            'type': 'sGrid',
-            'affine': list(vf.affine),
-            'shape': vf.shape,
-            'nodata': float(vf.nodata) if not np.isnan(vf.nodata) else 'nan',
-            'crs': str(vf.crs),
-            'mask_shape': vf.mask.shape,
-            'mask_dtype': str(vf.mask.dtype)
-        }
-        
-        with open(f"{base_path}_grid.json", 'w') as f:
-            json.dump(metadata, f, indent=2)
-        
-        # Save mask as compressed numpy array
-        np.savez_compressed(f"{base_path}_mask.npz", mask=vf.mask)
-        
-        print(f"sGrid saved to {base_path}.json and {base_path}_mask.npz")
+        base_path.parent.mkdir(parents=True, exist_ok=True)
+
+        arrays, metadata = _sgrid_payload(grid)
+        path = _write_container(base_path, arrays, metadata)
+
+        logger.debug("sGrid saved to %s", path)
 
     @staticmethod
     def load_sgrid(base_filename: Union[str, Path]) -> sGrid:
         """
-        Load an sGrid object from JSON + NumPy format.
-        
+        Load an sGrid object saved by `save_sgrid`.
+
         Parameters
         ----------
         base_filename : str or Path
             Base filename (without extension)
-            
+
         Returns
         -------
         sGrid
             The loaded sGrid object
         """
         base_path = Path(base_filename)
-        
-        # Load metadata
-        with open(f"{base_path}_grid.json", 'r') as f:
-            metadata = json.load(f)
-        
+
+        container = _open_container(base_path)
+        if container is not None:
+            metadata, arrays = container
+            mask = _load_mask(metadata, lambda: arrays['mask'])
+        else:
+            # Legacy sidecar layout: JSON metadata plus one file per array
+            metadata = _read_meta(f"{base_path}_grid.json")
+            mask = _load_mask(metadata, lambda: _read_array(
+                base_path, 'mask', metadata.get('backend', 'npz')))
+
         if metadata['type'] != 'sGrid':
             raise ValueError(f"Expected sGrid, got {metadata['type']}")
-        
-        # Load mask
-        mask_data = np.load(f"{base_path}_mask.npz")
-        mask = mask_data['mask']
-        
-        # Handle NaN nodata values and ensure proper numpy type
-        nodata = metadata['nodata']
-        if nodata == 'nan':
-            nodata = np.nan
-        else:
-            nodata = np.float64(nodata)
-        
-        # Reconstruct ViewFinder
-        affine = Affine(*metadata['affine'])
-        viewfinder = ViewFinder(
-            affine=affine,
-            shape=tuple(metadata['shape']),
-            nodata=nodata,
-            mask=mask,
-            crs=projection.to_proj(metadata['crs'])
-        )
-        
-        return sGrid(viewfinder)
+
+        return _reconstruct_sgrid(metadata, mask)
 
     @staticmethod
-    def save_raster(raster: Union[Raster, MultiRaster], base_filename: Union[str, Path]) -> None:
+    def save_raster(raster: Union[Raster, MultiRaster], base_filename: Union[str, Path],
+                    compressed: bool = True, dtype_out: Union[str, np.dtype, None] = None,
+                    scale: Optional[float] = None, offset: Optional[float] = None) -> None:
         """
-        Save a Raster or MultiRaster object using JSON + NumPy format.
-        
+        Save a Raster or MultiRaster object to a single `.pysh` container.
+
         Parameters
         ----------
         raster : Raster or MultiRaster
             The raster object to save
         base_filename : str or Path
             Base filename (without extension)
+        compressed : bool
+            If False, write the data array to an uncompressed `.npy`
+            sidecar instead of the compressed container, so `load_raster`
+            can memory-map it (zero-copy, lazy page-faulted reads)
+        dtype_out : str, np.dtype or None
+            Optional lossy quantization of the data on disk: 'float32'
+            casts float64 down, 'int16' stores `round((data - offset) /
+            scale)` and dequantizes to float32 on load
+        scale : float, optional
+            Quantization step for `dtype_out='int16'`
+        offset : float, optional
+            Quantization offset for `dtype_out='int16'` (default 0)
         """
 
         base_path = Path(base_filename)
-        base_path.mkdir(parents=True, exist_ok=True)
-
-        vf = raster.viewfinder
-        
-        # Determine raster type
-        raster_type = 'MultiRaster' if isinstance(raster, MultiRaster) else 'Raster'
-        
-        # Save metadata as JSON
-        metadata = {
-            'type': raster_type,
-            'data_shape': raster.shape,
-            'data_dtype': str(raster.dtype),
-            'affine': list(vf.affine),
-            'viewfinder_shape': vf.shape,
-            'nodata': float(vf.nodata) if not np.isnan(vf.nodata) else 'nan',
-            'crs': str(vf.crs),
-            'mask_shape': vf.mask.shape,
-            'mask_dtype': str(vf.mask.dtype),
-            'metadata': raster.metadata
-        }
-        
-        with open(f"{base_path}_raster.json", 'w') as f:
-            json.dump(metadata, f, indent=2)
-        
-        # Save raster data as compressed numpy array
-        np.savez_compressed(f"{base_path}_data.npz", data=np.asarray(raster))
-        
-        # Save mask as compressed numpy array
-        np.savez_compressed(f"{base_path}_mask.npz", mask=vf.mask)
-        
-        print(f"{raster_type} saved to {base_path}.json, {base_path}_data.npz, and {base_path}_mask.npz")
+        base_path.parent.mkdir(parents=True, exist_ok=True)
+
+        arrays, metadata = _raster_payload(raster)
+        if dtype_out is not None:
+            _quantize(arrays, metadata, dtype_out, scale, offset)
+        if not compressed:
+            # Uncompressed sidecar enables np.load(..., mmap_mode='r');
+            # split bands are restacked so the sidecar is one mappable file
+            data = np.stack([arrays.pop(key) for key in _data_keys(metadata)])
+            if metadata.pop('band_split', None) is None:
+                data = data[0]
+            np.save(f"{base_path}_data.npy", data)
+            metadata['data_file'] = 'npy'
+        path = _write_container(base_path, arrays, metadata)
+
+        logger.debug("%s saved to %s", metadata['type'], path)
 
     @staticmethod
-    def load_raster(base_filename: Union[str, Path]) -> Union[Raster, MultiRaster]:
+    def save_raster_async(raster: Union[Raster, MultiRaster],
+                          base_filename: Union[str, Path]) -> 'concurrent.futures.Future':
         """
-        Load a Raster or MultiRaster object from JSON + NumPy format.
-        
+        Save a Raster or MultiRaster on a background thread, returning
+        immediately so the caller can overlap computation with I/O.
+
+        The raster data and viewfinder are snapshotted synchronously (a
+        cheap memcpy), so the caller may freely mutate the raster after
+        this returns. Call `flush` (or `result()` on the returned future)
+        to block until the write has completed; `flush` is also registered
+        with `atexit` so pending writes cannot be lost at interpreter exit.
+
         Parameters
         ----------
+        raster : Raster or MultiRaster
+            The raster object to save
         base_filename : str or Path
             Base filename (without extension)
-            
+
+        Returns
+        -------
+        concurrent.futures.Future
+            Future resolving when the save has completed
+        """
+        # Snapshot synchronously; compression and disk I/O happen on the
+        # background thread
+        raster_cls = MultiRaster if isinstance(raster, MultiRaster) else Raster
+        snapshot = raster_cls(np.asarray(raster).copy(), raster.viewfinder.copy(),
+                              raster.metadata)
+        return _submit_write(PyshedsSerializer.save_raster, snapshot, base_filename)
+
+    @staticmethod
+    def flush() -> None:
+        """Block until all pending asynchronous saves have completed."""
+        with _PENDING_LOCK:
+            pending = list(_PENDING_WRITES)
+            _PENDING_WRITES.clear()
+        for future in pending:
+            future.result()
+
+    @staticmethod
+    def load_raster(base_filename: Union[str, Path], mmap: bool = False,
+                    window: Optional[Tuple[slice, slice]] = None) -> Union[Raster, MultiRaster]:
+        """
+        Load a Raster or MultiRaster object saved by `save_raster`.
+
+        Parameters
+        ----------
+        base_filename : str or Path
+            Base filename (without extension)
+        mmap : bool
+            If True and the raster was saved with `compressed=False`,
+            memory-map the data array instead of materializing it, so
+            only the pages actually touched are read from disk
+        window : tuple of (row_slice, col_slice), optional
+            Load only a subregion of the raster. Zarr-backed containers
+            decompress only the chunks the window touches; MultiRaster
+            windows apply to every band. The affine transform is shifted
+            to the window's top-left corner.
+
         Returns
         -------
         Raster or MultiRaster
             The loaded raster object
         """
         base_path = Path(base_filename)
-        
-        # Load metadata
-        with open(f"{base_path}_raster.json", 'r') as f:
-            metadata = json.load(f)
-        
-        if metadata['type'] not in ['Raster', 'MultiRaster']:
-            raise ValueError(f"Expected Raster or MultiRaster, got {metadata['type']}")
-        
-        # Load data and mask
-        data_file = np.load(f"{base_path}_data.npz")
-        mask_file = np.load(f"{base_path}_mask.npz")
-        
-        data = data_file['data']
-        mask = mask_file['mask']
-        
-        # Handle NaN nodata values and ensure proper numpy type
-        nodata = metadata['nodata']
-        if nodata == 'nan':
-            nodata = np.nan
-        else:
-            # Cast to numpy type that matches the data dtype
-            data_dtype = np.dtype(metadata['data_dtype'])
-            if np.issubdtype(data_dtype, np.floating):
-                if data_dtype == np.float32:
-                    nodata = np.float32(nodata)
-                else:
-                    nodata = np.float64(nodata)
-            elif np.issubdtype(data_dtype, np.integer):
-                if data_dtype == np.int16:
-                    nodata = np.int16(nodata)
-                elif data_dtype == np.int32:
-                    nodata = np.int32(nodata)
-                else:
-                    nodata = np.int64(nodata)
+
+        container = _open_container(base_path)
+        if container is not None:
+            metadata, arrays = container
+            if metadata.get('data_file') == 'npy':
+                data = np.load(f"{base_path}_data.npy",
+                               mmap_mode='r' if mmap else None)
+                if window is not None:
+                    data = data[_window_index(metadata, window)]
             else:
-                raise ValueError(f"Unsupported data dtype: {data_dtype}")
-        
-        # Reconstruct ViewFinder
-        affine = Affine(*metadata['affine'])
-        viewfinder = ViewFinder(
-            affine=affine,
-            shape=tuple(metadata['viewfinder_shape']),
-            nodata=nodata,
-            mask=mask,
-            crs=projection.to_proj(metadata['crs'])
-        )
-        
-        # Create appropriate raster type
-        if metadata['type'] == 'MultiRaster':
-            return MultiRaster(data, viewfinder, metadata['metadata'])
+                data = _load_data(metadata, arrays, window)
+            mask = _load_mask(metadata, lambda: arrays['mask'])
         else:
-            return Raster(data, viewfinder, metadata['metadata'])
+            # Legacy sidecar layout: JSON metadata plus one file per array
+            metadata = _read_meta(f"{base_path}_raster.json")
+            backend = metadata.get('backend', 'npz')
+            data = _read_array(base_path, 'data', backend)
+            if window is not None:
+                data = data[_window_index(metadata, window)]
+            mask = _load_mask(metadata, lambda: _read_array(base_path, 'mask', backend))
+
+        if metadata['type'] not in ['Raster', 'MultiRaster']:
+            raise ValueError(f"Expected Raster or MultiRaster, got {metadata['type']}")
+
+        if window is not None:
+            mask = mask[_window_index(metadata, window)]
+            metadata = _window_metadata(metadata, window)
+
+        return _reconstruct_raster(metadata, _dequantize(metadata, data), mask)
 
     @staticmethod
     def save_objects(objects: Dict[str, Any], base_filename: Union[str, Path]) -> None:
         """
-        Save multiple pysheds objects to a single set of files.
-        
+        Save multiple pysheds objects to a single container.
+
+        With zarr available the whole bundle is one zarr group with one
+        subgroup per object; otherwise one `.pysh.npz` container is
+        written per object alongside the JSON index.
+
         Parameters
         ----------
         objects : dict
@@ -225,68 +716,174 @@ class PyshedsSerializer:
             Base filename (without extension)
         """
         base_path = Path(base_filename)
-        base_path.mkdir(parents=True, exist_ok=True)
-        
+        base_path.parent.mkdir(parents=True, exist_ok=True)
+
         # Metadata for all objects
         all_metadata = {
             'objects': {},
             'saved_files': []
         }
-        
-        for name, obj in objects.items():
+
+        root = zarr.open_group(f"{base_path}.pysh", mode='w') if _HAS_ZARR else None
+
+        # Objects in a bundle usually share a grid, so serialize each
+        # unique CRS (pyproj WKT formatting is expensive) and affine once
+        # into a shared block and reference them by integer id. Only the
+        # zarr bundle stores refs, since its metadata and shared block
+        # live in the same store; standalone containers stay self-contained.
+        shared = None
+        shared_refs: Dict[str, Tuple[int, int]] = {}
+        if root is not None:
+            shared = {'crs': [], 'affine': []}
+            crs_by_instance: Dict[int, int] = {}
+            crs_ids: Dict[str, int] = {}
+            affine_ids: Dict[tuple, int] = {}
+            for name, obj in objects.items():
+                vf = getattr(obj, 'viewfinder', None)
+                if vf is None:
+                    continue
+                crs_id = crs_by_instance.get(id(vf.crs))
+                if crs_id is None:
+                    crs_str = str(vf.crs)
+                    crs_id = crs_ids.setdefault(crs_str, len(shared['crs']))
+                    if crs_id == len(shared['crs']):
+                        shared['crs'].append(crs_str)
+                    crs_by_instance[id(vf.crs)] = crs_id
+                affine = tuple(vf.affine)
+                affine_id = affine_ids.setdefault(affine, len(shared['affine']))
+                if affine_id == len(shared['affine']):
+                    shared['affine'].append(list(affine))
+                shared_refs[name] = (crs_id, affine_id)
+
+        def _save_one(item):
+            name, obj = item
             if isinstance(obj, sGrid):
-                PyshedsSerializer.save_sgrid(obj, f"{base_path}_{name}")
-                all_metadata['objects'][name] = 'sGrid'
-                all_metadata['saved_files'].extend([
-                    f"{base_path}_{name}.json",
-                    f"{base_path}_{name}_mask.npz"
-                ])
+                arrays, metadata = _sgrid_payload(obj, shared_refs.get(name))
             elif isinstance(obj, (Raster, MultiRaster)):
-                PyshedsSerializer.save_raster(obj, f"{base_path}_{name}")
-                raster_type = 'MultiRaster' if isinstance(obj, MultiRaster) else 'Raster'
-                all_metadata['objects'][name] = raster_type
-                all_metadata['saved_files'].extend([
-                    f"{base_path}_{name}.json",
-                    f"{base_path}_{name}_data.npz",
-                    f"{base_path}_{name}_mask.npz"
-                ])
+                arrays, metadata = _raster_payload(obj, shared_refs.get(name))
+            else:
+                logger.warning("Object '%s' of type %s not supported", name, type(obj))
+                return None
+            if root is not None:
+                _write_group(root.create_group(name), arrays, metadata)
+                return name, metadata['type'], []
             else:
-                print(f"Warning: Object '{name}' of type {type(obj)} not supported")
-        
-        # Save index file
-        with open(f"{base_path}_index.json", 'w') as f:
-            json.dump(all_metadata, f, indent=2)
-        
-        print(f"Index saved to {base_path}_index.json")
+                path = _write_container(f"{base_path}_{name}", arrays, metadata)
+                return name, metadata['type'], [path]
+
+        # Each object writes independent chunks and compression releases the
+        # GIL, so saving in parallel scales up to disk bandwidth
+        items = list(objects.items())
+        if items:
+            max_workers = min(16, len(items))
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(_save_one, items))
+            # Aggregate metadata after all futures complete to avoid
+            # concurrent writes to the shared dict
+            for result in results:
+                if result is not None:
+                    name, obj_type, saved_files = result
+                    all_metadata['objects'][name] = obj_type
+                    all_metadata['saved_files'].extend(saved_files)
+
+        if root is not None:
+            all_metadata['saved_files'].append(f"{base_path}.pysh")
+            all_metadata['shared'] = shared
+            root.attrs['objects'] = all_metadata['objects']
+            root.attrs['shared'] = shared
+
+        # Save index file; very large indexes are written as NDJSON (one
+        # object per line) so readers can stream them instead of holding
+        # the whole index in memory. A stale index of the other format
+        # from a previous save over the same base path would shadow the
+        # new one on load, so drop it before writing
+        if len(all_metadata['objects']) > _NDJSON_THRESHOLD:
+            index_path = f"{base_path}_index.ndjson"
+            Path(f"{base_path}_index.json").unlink(missing_ok=True)
+            with open(index_path, 'wb') as f:
+                for name, obj_type in all_metadata['objects'].items():
+                    f.write(_dumps({'name': name, 'type': obj_type}) + b'\n')
+        else:
+            index_path = f"{base_path}_index.json"
+            Path(f"{base_path}_index.ndjson").unlink(missing_ok=True)
+            Path(index_path).write_bytes(_dumps(all_metadata))
+
+        logger.debug("Index saved to %s", index_path)
 
     @staticmethod
     def load_objects(base_filename: Union[str, Path]) -> Dict[str, Any]:
         """
-        Load multiple pysheds objects from a single set of files.
-        
+        Load multiple pysheds objects saved by `save_objects`.
+
         Parameters
         ----------
         base_filename : str or Path
             Base filename (without extension)
-            
+
         Returns
         -------
         dict
             Dictionary of {name: object}
         """
         base_path = Path(base_filename)
-        
-        # Load index
-        with open(f"{base_path}_index.json", 'r') as f:
-            index = json.load(f)
-        
-        objects = {}
-        for name, obj_type in index['objects'].items():
+
+        # Single-group bundle written with zarr
+        bundle_path = Path(f"{base_path}.pysh")
+        if bundle_path.exists() and _HAS_ZARR:
+            root = zarr.open_group(str(bundle_path), mode='r')
+            shared = root.attrs.get('shared')
+
+            def _load_group(name):
+                group = root[name]
+                metadata = _resolve_shared(dict(group.attrs), shared)
+                mask = _load_mask(metadata, lambda: group['mask'])
+                if metadata['type'] == 'sGrid':
+                    return name, _reconstruct_sgrid(metadata, mask)
+                return name, _reconstruct_raster(metadata, _load_data(metadata, group),
+                                                 mask)
+
+            names = list(root.attrs.get('objects', {}))
+            objects = {}
+            if names:
+                max_workers = min(16, len(names))
+                with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    for name, obj in executor.map(_load_group, names):
+                        objects[name] = obj
+            return objects
+
+        # Load index; NDJSON indexes are parsed one line at a time
+        ndjson_path = Path(f"{base_path}_index.ndjson")
+        if ndjson_path.exists():
+            def _iter_items():
+                with open(ndjson_path, 'rb') as f:
+                    for line in f:
+                        if line.strip():
+                            entry = _loads(line)
+                            yield entry['name'], entry['type']
+            index = {'objects': dict(_iter_items())}
+        else:
+            index = _read_meta(f"{base_path}_index.json")
+
+        def _load_one(item):
+            name, obj_type = item
             if obj_type == 'sGrid':
-                objects[name] = PyshedsSerializer.load_sgrid(f"{base_path}_{name}")
+                return name, PyshedsSerializer.load_sgrid(f"{base_path}_{name}")
             elif obj_type in ['Raster', 'MultiRaster']:
-                objects[name] = PyshedsSerializer.load_raster(f"{base_path}_{name}")
-        
+                return name, PyshedsSerializer.load_raster(f"{base_path}_{name}")
+            return name, None
+
+        # Decompression releases the GIL, so load objects in parallel
+        items = list(index['objects'].items())
+        objects = {}
+        if items:
+            max_workers = min(16, len(items))
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(_load_one, item) for item in items]
+                for future in futures:
+                    name, obj = future.result()
+                    if obj is not None:
+                        objects[name] = obj
+
         return objects
 
 
@@ -299,13 +896,26 @@ def load_sgrid(base_filename: Union[str, Path]) -> sGrid:
     """Convenience function to load an sGrid."""
     return PyshedsSerializer.load_sgrid(base_filename)
 
-def save_raster(raster: Union[Raster, MultiRaster], base_filename: Union[str, Path]) -> None:
+def save_raster(raster: Union[Raster, MultiRaster], base_filename: Union[str, Path],
+                compressed: bool = True, dtype_out: Union[str, np.dtype, None] = None,
+                scale: Optional[float] = None, offset: Optional[float] = None) -> None:
     """Convenience function to save a Raster or MultiRaster."""
-    PyshedsSerializer.save_raster(raster, base_filename)
+    PyshedsSerializer.save_raster(raster, base_filename, compressed=compressed,
+                                  dtype_out=dtype_out, scale=scale, offset=offset)
+
+def save_raster_async(raster: Union[Raster, MultiRaster],
+                      base_filename: Union[str, Path]) -> 'concurrent.futures.Future':
+    """Convenience function to save a Raster or MultiRaster asynchronously."""
+    return PyshedsSerializer.save_raster_async(raster, base_filename)
+
+def flush() -> None:
+    """Convenience function to wait for all pending asynchronous saves."""
+    PyshedsSerializer.flush()
 
-def load_raster(base_filename: Union[str, Path]) -> Union[Raster, MultiRaster]:
+def load_raster(base_filename: Union[str, Path], mmap: bool = False,
+                window: Optional[Tuple[slice, slice]] = None) -> Union[Raster, MultiRaster]:
     """Convenience function to load a Raster or MultiRaster."""
-    return PyshedsSerializer.load_raster(base_filename)
+    return PyshedsSerializer.load_raster(base_filename, mmap=mmap, window=window)
 
 def save_objects(objects: Dict[str, Any], base_filename: Union[str, Path]) -> None:
     """Convenience function to save multiple objects."""
@@ -314,3 +924,7 @@ def save_objects(objects: Dict[str, Any], base_filename: Union[str, Path]) -> No
 def load_objects(base_filename: Union[str, Path]) -> Dict[str, Any]:
     """Convenience function to load multiple objects."""
     return PyshedsSerializer.load_objects(base_filename)
+
+
+# Ensure pending asynchronous saves complete before interpreter exit
+atexit.register(PyshedsSerializer.flush)
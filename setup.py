@@ -55,6 +55,7 @@ setup(
     ],
     extras_require=dict(
         dev=["pytest", "pytest-cov"],
-        recipes=["geopandas", "ipython", "matplotlib", "seaborn"]
+        recipes=["geopandas", "ipython", "matplotlib", "seaborn"],
+        serializer=["zarr>=2,<3", "numcodecs", "orjson"]
     ),
 )
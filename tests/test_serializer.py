@@ -0,0 +1,276 @@
+import json
+
+import numpy as np
+import pytest
+from affine import Affine
+
+import pysheds.serializer as serializer
+from pysheds.serializer import PyshedsSerializer
+from pysheds.sgrid import sGrid
+from pysheds.sview import Raster, MultiRaster, ViewFinder
+
+
+affine = Affine(0.5, 0.0, -97.5, 0.0, -0.5, 32.8)
+shape = (40, 50)
+
+
+def generate_mask():
+    mask = np.ones(shape, dtype=bool)
+    mask[3:7, 4:9] = False
+    return mask
+
+
+def generate_raster(nodata=np.float64(-9999.0)):
+    viewfinder = ViewFinder(affine=affine, shape=shape, nodata=nodata,
+                            mask=generate_mask())
+    data = np.arange(shape[0] * shape[1], dtype=np.float64).reshape(shape) / 100.0
+    return Raster(data, viewfinder, metadata={'source': 'test'})
+
+
+def generate_multiraster():
+    mask = np.broadcast_to(generate_mask(), (3,) + shape).copy()
+    viewfinder = ViewFinder(affine=affine, shape=(3,) + shape,
+                            nodata=np.float64(-9999.0), mask=mask)
+    data = np.random.rand(3, *shape)
+    return MultiRaster(data, viewfinder)
+
+
+def generate_sgrid():
+    viewfinder = ViewFinder(affine=affine, shape=shape,
+                            nodata=np.float64(-9999.0), mask=generate_mask())
+    return sGrid(viewfinder)
+
+
+@pytest.fixture(params=['zarr', 'npz'])
+def backend(request, monkeypatch):
+    """Run the test against both container formats."""
+    if request.param == 'zarr' and not serializer._HAS_ZARR:
+        pytest.skip('zarr not available')
+    if request.param == 'npz':
+        monkeypatch.setattr(serializer, '_HAS_ZARR', False)
+    return request.param
+
+
+def assert_rasters_equal(expected, loaded):
+    assert type(loaded) is type(expected)
+    assert np.allclose(np.asarray(expected), np.asarray(loaded))
+    assert (loaded.viewfinder.mask == expected.viewfinder.mask).all()
+    assert tuple(loaded.viewfinder.affine) == tuple(expected.viewfinder.affine)
+    assert loaded.viewfinder.nodata == expected.viewfinder.nodata
+    assert loaded.metadata == expected.metadata
+
+
+def test_raster_roundtrip(backend, tmp_path):
+    raster = generate_raster()
+    PyshedsSerializer.save_raster(raster, tmp_path / 'raster')
+    loaded = PyshedsSerializer.load_raster(tmp_path / 'raster')
+    assert_rasters_equal(raster, loaded)
+
+
+def test_multiraster_roundtrip(backend, tmp_path):
+    raster = generate_multiraster()
+    PyshedsSerializer.save_raster(raster, tmp_path / 'bands')
+    loaded = PyshedsSerializer.load_raster(tmp_path / 'bands')
+    assert_rasters_equal(raster, loaded)
+
+
+def test_sgrid_roundtrip(backend, tmp_path):
+    grid = generate_sgrid()
+    PyshedsSerializer.save_sgrid(grid, tmp_path / 'grid')
+    loaded = PyshedsSerializer.load_sgrid(tmp_path / 'grid')
+    assert (loaded.viewfinder.mask == grid.viewfinder.mask).all()
+    assert tuple(loaded.viewfinder.affine) == tuple(affine)
+    assert loaded.viewfinder.nodata == grid.viewfinder.nodata
+
+
+def test_loaded_sgrids_do_not_share_viewfinders(backend, tmp_path):
+    PyshedsSerializer.save_sgrid(generate_sgrid(), tmp_path / 'grid')
+    first = PyshedsSerializer.load_sgrid(tmp_path / 'grid')
+    second = PyshedsSerializer.load_sgrid(tmp_path / 'grid')
+    first.nodata = np.float64(123.0)
+    assert second.nodata == -9999.0
+
+
+def test_roundtrip_without_orjson(tmp_path, monkeypatch):
+    monkeypatch.setattr(serializer, '_dumps',
+                        lambda obj: json.dumps(obj, separators=(',', ':')).encode())
+    monkeypatch.setattr(serializer, '_loads', json.loads)
+    monkeypatch.setattr(serializer, '_HAS_ZARR', False)
+    raster = generate_raster()
+    PyshedsSerializer.save_raster(raster, tmp_path / 'raster')
+    assert_rasters_equal(raster, PyshedsSerializer.load_raster(tmp_path / 'raster'))
+
+
+def test_constant_mask_roundtrip(backend, tmp_path):
+    viewfinder = ViewFinder(affine=affine, shape=shape, nodata=np.float64(0.0))
+    raster = Raster(np.random.rand(*shape), viewfinder)
+    PyshedsSerializer.save_raster(raster, tmp_path / 'raster')
+    loaded = PyshedsSerializer.load_raster(tmp_path / 'raster')
+    assert loaded.viewfinder.mask.all()
+    assert np.allclose(np.asarray(raster), np.asarray(loaded))
+
+
+def test_integer_nodata_roundtrip(backend, tmp_path):
+    viewfinder = ViewFinder(affine=affine, shape=shape, nodata=np.int32(-1),
+                            mask=generate_mask())
+    raster = Raster(np.arange(2000, dtype=np.int32).reshape(shape), viewfinder)
+    PyshedsSerializer.save_raster(raster, tmp_path / 'raster')
+    loaded = PyshedsSerializer.load_raster(tmp_path / 'raster')
+    assert loaded.viewfinder.nodata == -1
+    assert loaded.dtype == np.int32
+    assert (np.asarray(raster) == np.asarray(loaded)).all()
+
+
+def test_float32_quantization(backend, tmp_path):
+    raster = generate_raster()
+    PyshedsSerializer.save_raster(raster, tmp_path / 'raster', dtype_out='float32')
+    loaded = PyshedsSerializer.load_raster(tmp_path / 'raster')
+    assert loaded.dtype == np.float32
+    assert np.allclose(np.asarray(raster), np.asarray(loaded))
+
+
+def test_int16_quantization_preserves_nodata(backend, tmp_path):
+    mask = generate_mask()
+    raster = generate_raster()
+    raster[~mask] = -9999.0
+    PyshedsSerializer.save_raster(raster, tmp_path / 'raster',
+                                  dtype_out='int16', scale=0.001)
+    loaded = PyshedsSerializer.load_raster(tmp_path / 'raster')
+    # Nodata sentinels are restored exactly rather than wrapped by the
+    # int16 scaling; data cells dequantize to within one scale step
+    assert (np.asarray(loaded)[~mask] == np.float32(-9999.0)).all()
+    assert np.allclose(np.asarray(loaded)[mask], np.asarray(raster)[mask],
+                       atol=0.001)
+    assert loaded.viewfinder.nodata == -9999.0
+
+
+def test_int16_quantization_preserves_nan_nodata(backend, tmp_path):
+    mask = generate_mask()
+    viewfinder = ViewFinder(affine=affine, shape=shape,
+                            nodata=np.float64(np.nan), mask=mask)
+    data = np.random.rand(*shape) * 20.0
+    data[~mask] = np.nan
+    raster = Raster(data, viewfinder)
+    PyshedsSerializer.save_raster(raster, tmp_path / 'raster',
+                                  dtype_out='int16', scale=0.001)
+    loaded = PyshedsSerializer.load_raster(tmp_path / 'raster')
+    assert np.isnan(np.asarray(loaded)[~mask]).all()
+    assert np.allclose(np.asarray(loaded)[mask], data[mask], atol=0.001)
+    assert np.isnan(loaded.viewfinder.nodata)
+
+
+def test_int16_quantization_out_of_range_raises(backend, tmp_path):
+    raster = generate_raster()
+    raster[0, 0] = 1e6
+    with pytest.raises(ValueError, match='int16 range'):
+        PyshedsSerializer.save_raster(raster, tmp_path / 'raster',
+                                      dtype_out='int16', scale=0.001)
+
+
+def test_windowed_load(backend, tmp_path):
+    raster = generate_raster()
+    PyshedsSerializer.save_raster(raster, tmp_path / 'raster')
+    window = (slice(5, 15), slice(10, 30))
+    loaded = PyshedsSerializer.load_raster(tmp_path / 'raster', window=window)
+    assert loaded.shape == (10, 20)
+    assert np.allclose(np.asarray(raster)[window], np.asarray(loaded))
+    assert (loaded.viewfinder.mask == raster.viewfinder.mask[window]).all()
+    # Affine origin shifts to the window's top-left corner
+    assert tuple(loaded.viewfinder.affine) == tuple(affine * Affine.translation(10, 5))
+
+
+def test_mmap_load(backend, tmp_path):
+    raster = generate_raster()
+    PyshedsSerializer.save_raster(raster, tmp_path / 'raster', compressed=False)
+    assert (tmp_path / 'raster_data.npy').exists()
+    loaded = PyshedsSerializer.load_raster(tmp_path / 'raster', mmap=True)
+    assert_rasters_equal(raster, loaded)
+
+
+def test_async_save(backend, tmp_path):
+    raster = generate_raster()
+    future = PyshedsSerializer.save_raster_async(raster, tmp_path / 'raster')
+    # Mutating the raster after submission must not affect the snapshot
+    raster[0, 0] = -1.0
+    future.result()
+    PyshedsSerializer.flush()
+    loaded = PyshedsSerializer.load_raster(tmp_path / 'raster')
+    assert np.asarray(loaded)[0, 0] != -1.0
+
+
+def test_objects_roundtrip(backend, tmp_path):
+    raster = generate_raster()
+    bands = generate_multiraster()
+    grid = generate_sgrid()
+    PyshedsSerializer.save_objects({'dem': raster, 'bands': bands, 'grid': grid},
+                                   tmp_path / 'bundle')
+    loaded = PyshedsSerializer.load_objects(tmp_path / 'bundle')
+    assert sorted(loaded) == ['bands', 'dem', 'grid']
+    assert_rasters_equal(raster, loaded['dem'])
+    assert_rasters_equal(bands, loaded['bands'])
+    assert (loaded['grid'].viewfinder.mask == grid.viewfinder.mask).all()
+
+
+def test_resave_drops_stale_index(tmp_path, monkeypatch):
+    # Re-saving a small bundle over a large one must not leave the old
+    # NDJSON index shadowing the new JSON one (and vice versa)
+    monkeypatch.setattr(serializer, '_HAS_ZARR', False)
+    monkeypatch.setattr(serializer, '_NDJSON_THRESHOLD', 4)
+    base = tmp_path / 'bundle'
+    large = {f'r{i}': generate_raster() for i in range(6)}
+    PyshedsSerializer.save_objects(large, base)
+    assert (tmp_path / 'bundle_index.ndjson').exists()
+    PyshedsSerializer.save_objects({'only': generate_raster()}, base)
+    assert not (tmp_path / 'bundle_index.ndjson').exists()
+    assert sorted(PyshedsSerializer.load_objects(base)) == ['only']
+    PyshedsSerializer.save_objects(large, base)
+    assert not (tmp_path / 'bundle_index.json').exists()
+    assert sorted(PyshedsSerializer.load_objects(base)) == sorted(large)
+
+
+def test_load_legacy_npz_sidecars(tmp_path):
+    # Layout written before the .pysh container: JSON metadata alongside
+    # one npz file per array
+    raster = generate_raster()
+    viewfinder = raster.viewfinder
+    metadata = {
+        'type': 'Raster',
+        'backend': 'npz',
+        'data_shape': raster.shape,
+        'data_dtype': str(raster.dtype),
+        'viewfinder_shape': viewfinder.shape,
+        'nodata': float(viewfinder.nodata),
+        'mask_shape': viewfinder.mask.shape,
+        'mask_dtype': str(viewfinder.mask.dtype),
+        'metadata': raster.metadata,
+        'affine': list(viewfinder.affine),
+        'crs': str(viewfinder.crs),
+    }
+    (tmp_path / 'raster_raster.json').write_text(json.dumps(metadata))
+    np.savez_compressed(tmp_path / 'raster_data.npz', data=np.asarray(raster))
+    np.savez_compressed(tmp_path / 'raster_mask.npz', mask=viewfinder.mask)
+    loaded = PyshedsSerializer.load_raster(tmp_path / 'raster')
+    assert_rasters_equal(raster, loaded)
+
+
+def test_load_legacy_zarr_sidecars(tmp_path):
+    if not serializer._HAS_ZARR:
+        pytest.skip('zarr not available')
+    import zarr
+    grid = generate_sgrid()
+    viewfinder = grid.viewfinder
+    metadata = {
+        'type': 'sGrid',
+        'backend': 'zarr',
+        'shape': viewfinder.shape,
+        'nodata': float(viewfinder.nodata),
+        'mask_shape': viewfinder.mask.shape,
+        'mask_dtype': str(viewfinder.mask.dtype),
+        'affine': list(viewfinder.affine),
+        'crs': str(viewfinder.crs),
+    }
+    (tmp_path / 'grid_grid.json').write_text(json.dumps(metadata))
+    zarr.save_array(str(tmp_path / 'grid_mask.zarr'), viewfinder.mask)
+    loaded = PyshedsSerializer.load_sgrid(tmp_path / 'grid')
+    assert (loaded.viewfinder.mask == viewfinder.mask).all()
+    assert tuple(loaded.viewfinder.affine) == tuple(affine)